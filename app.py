@@ -5,15 +5,286 @@ Flask backend that serves the scraper functionality via a web interface
 """
 
 import os
+import time
+import atexit
+import hashlib
 import logging
-from flask import Flask, render_template, request, jsonify
-from reelgood_scraper import scrape_all_regions, search_reelgood, REGIONS
+import functools
+import threading
+import orjson
+from flask import Flask, Response, render_template, request, jsonify
+from flask.json.provider import JSONProvider
+from werkzeug.wsgi import ClosingIterator
+from reelgood_scraper import BROWSER_JOB_TIMEOUT, BrowserPool, iter_all_regions, search_reelgood, REGIONS
+
+try:
+    import redis
+except ImportError:
+    redis = None
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+class ORJSONProvider(JSONProvider):
+    """JSON provider that serializes responses with orjson"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response instead of decoding
+        # them in dumps() only for Flask to encode them again
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj), mimetype='application/json')
+
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
+
+# Chromium is launched once per process and kept warm between requests.
+# Each pool worker owns one browser, so the size caps how many region pages
+# are scraped in parallel (and how much memory Chromium can use)
+BROWSER_POOL = BrowserPool(size=int(os.environ.get('BROWSER_POOL_SIZE', 3)))
+atexit.register(BROWSER_POOL.close)
+
+# Request threads only wait on the browser pool, so many requests can be in
+# flight at once. Two caps turn requests away with a 503 rather than letting
+# them queue, and together they stay below the Gunicorn thread count so there
+# are always threads left to send the 503s and serve cache hits:
+# - MAX_PENDING_SCRAPES: distinct scrapes and searches running (quarter of the
+#   threads by default)
+# - MAX_WAITING_REQUESTS: /scrape and /scrape/stream requests waiting on a
+#   scrape, including ones sharing another request's scrape (half the threads)
+GUNICORN_THREADS = int(os.environ.get('GUNICORN_THREADS', 16))
+MAX_PENDING_SCRAPES = int(os.environ.get('MAX_PENDING_SCRAPES', max(1, GUNICORN_THREADS // 4)))
+MAX_WAITING_REQUESTS = int(os.environ.get('MAX_WAITING_REQUESTS', max(1, GUNICORN_THREADS // 2)))
+pending_scrapes = threading.BoundedSemaphore(MAX_PENDING_SCRAPES)
+waiting_requests = threading.BoundedSemaphore(MAX_WAITING_REQUESTS)
+
+
+def busy_response():
+    """503 response for when the server can't take on another scrape"""
+    logger.warning("Too many scrapes in progress, rejecting request")
+    return jsonify({'error': 'Server is busy, please try again in a moment'}), 503
+
+
+def limit_pending(view):
+    """Reject requests with a 503 once MAX_PENDING_SCRAPES are in progress"""
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        if not pending_scrapes.acquire(blocking=False):
+            return busy_response()
+        try:
+            return view(*args, **kwargs)
+        finally:
+            pending_scrapes.release()
+    return wrapper
+
+
+# Optional Redis cache for /scrape responses. Availability changes over hours
+# or days, so repeat lookups are served from Redis instead of re-scraping.
+# Entries are kept past their TTL so they can be served (flagged as stale)
+# when a fresh scrape fails.
+REDIS_URL = os.environ.get('REDIS_URL')
+CACHE_TTL = int(os.environ.get('SCRAPE_CACHE_TTL', 86400))
+CACHE_RETENTION = int(os.environ.get('SCRAPE_CACHE_RETENTION', CACHE_TTL * 7))
+
+cache = None
+if REDIS_URL:
+    if redis is None:
+        logger.warning("REDIS_URL is set but the redis package is not installed; caching disabled")
+    else:
+        cache = redis.Redis.from_url(REDIS_URL, socket_timeout=2)
+
+
+def cache_key(url):
+    """Redis key for a scraped URL"""
+    return "scrape:" + hashlib.sha256(url.encode()).hexdigest()
+
+
+def get_cached(key):
+    """Return (response, age in seconds) from the cache, or (None, None)"""
+    if cache is None:
+        return None, None
+    try:
+        entry = cache.hgetall(key)
+    except redis.RedisError as e:
+        logger.warning(f"Cache read failed: {e}")
+        return None, None
+    if not entry:
+        return None, None
+    return orjson.loads(entry[b'body']), time.time() - float(entry[b'cached_at'])
+
+
+def set_cached(key, response):
+    """Store a response body and timestamp in the cache"""
+    if cache is None:
+        return
+    try:
+        pipe = cache.pipeline()
+        pipe.hset(key, mapping={'body': orjson.dumps(response), 'cached_at': time.time()})
+        pipe.expire(key, CACHE_RETENTION)
+        pipe.execute()
+    except redis.RedisError as e:
+        logger.warning(f"Cache write failed: {e}")
+
+
+def format_region(region_code, region_data):
+    """Shape one region's scrape result for the API response"""
+    region = {
+        'code': region_code,
+        'name': region_data['region'],
+        'subscription': region_data['platforms']['subscription'],
+        'free': region_data['platforms']['free'],
+        'platform_count': region_data['platform_count']
+    }
+    if 'error' in region_data:
+        region['error'] = region_data['error']
+    return region
+
+
+def is_complete(response):
+    """Whether every region in a response was scraped (only those get cached)"""
+    return not any('error' in region for region in response['regions'])
+
+
+class ScrapeBroadcast:
+    """
+    One in-progress scrape of a URL, shared by every request that asks for it.
+
+    The scrape runs on its own thread, so it finishes (and fills the cache)
+    even if the request that started it goes away. Regions are kept as they
+    arrive, so requests that join late replay them before waiting for more.
+    """
+
+    def __init__(self):
+        self.title = "Unknown Title"
+        self.regions = []
+        self.response = None
+        self.error = None
+        self.done = False
+        self._cond = threading.Condition()
+
+    def add_region(self, title, region):
+        with self._cond:
+            if self.title == "Unknown Title":
+                self.title = title
+            self.regions.append(region)
+            self._cond.notify_all()
+
+    def finish(self, response=None, error=None):
+        with self._cond:
+            self.response = response
+            self.error = error
+            self.done = True
+            self._cond.notify_all()
+
+    def events(self, timeout=BROWSER_JOB_TIMEOUT + 30):
+        """
+        Yield ('region', region) for each region as it arrives, then
+        ('done', response) or ('error', message). Raises TimeoutError if the
+        scrape hasn't finished within timeout seconds.
+        """
+        deadline = time.monotonic() + timeout
+        seen = 0
+        while True:
+            with self._cond:
+                while seen == len(self.regions) and not self.done:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(f"Scrape did not finish within {timeout}s")
+                    self._cond.wait(remaining)
+                new_regions = self.regions[seen:]
+                seen = len(self.regions)
+                done = self.done
+
+            for region in new_regions:
+                yield 'region', region
+
+            if done:
+                if self.error is not None:
+                    yield 'error', self.error
+                else:
+                    yield 'done', self.response
+                return
+
+    def wait(self, timeout=BROWSER_JOB_TIMEOUT + 30):
+        """Block until the scrape finishes; returns (response, error)"""
+        for _ in self.events(timeout):
+            pass
+        return self.response, self.error
+
+
+# Scrapes currently running, so concurrent requests for the same URL (from
+# /scrape or /scrape/stream) share one scrape instead of each starting their own
+broadcasts = {}
+broadcasts_lock = threading.Lock()
+
+
+def join_scrape(key, url):
+    """
+    Return the in-flight scrape for key, starting one if there isn't one.
+    Returns None if a new scrape is needed but MAX_PENDING_SCRAPES are running.
+    """
+    with broadcasts_lock:
+        broadcast = broadcasts.get(key)
+        if broadcast is not None:
+            logger.info(f"Joining in-flight scrape for: {url}")
+            return broadcast
+        if not pending_scrapes.acquire(blocking=False):
+            return None
+        broadcast = broadcasts[key] = ScrapeBroadcast()
+
+    threading.Thread(target=run_scrape, args=(key, url, broadcast), daemon=True).start()
+    return broadcast
+
+
+def run_scrape(key, url, broadcast):
+    """Scrape every region of url into broadcast, caching the full response"""
+    try:
+        logger.info(f"Starting scrape for URL: {url}")
+        for region_code, region_data in iter_all_regions(url, BROWSER_POOL):
+            title = region_data.pop('title')
+            broadcast.add_region(title, format_region(region_code, region_data))
+
+        logger.info(f"Scrape completed for: {url}")
+
+        # Keep dropdown order regardless of which region finished first
+        order = list(REGIONS)
+        response = {
+            'title': broadcast.title,
+            'url': url,
+            'regions': sorted(broadcast.regions, key=lambda region: order.index(region['code']))
+        }
+
+        errors = [region['error'] for region in response['regions'] if 'error' in region]
+        if errors and len(errors) == len(response['regions']):
+            logger.error(f"Scrape error: {errors[0]}")
+            broadcast.finish(error=f"Failed to scrape URL: {errors[0]}")
+            return
+
+        if is_complete(response):
+            set_cached(key, response)
+        broadcast.finish(response=response)
+
+    except Exception as e:
+        logger.exception(f"Scraping failed with exception: {str(e)}")
+        broadcast.finish(error=f'Scraping failed: {str(e)}')
+
+    finally:
+        with broadcasts_lock:
+            broadcasts.pop(key, None)
+        pending_scrapes.release()
+
+
+def sse_event(event, data):
+    """Format a Server-Sent Event"""
+    return f"event: {event}\ndata: {orjson.dumps(data).decode()}\n\n"
 
 
 @app.route('/')
@@ -35,42 +306,106 @@ def scrape():
     if 'reelgood.com' not in url:
         return jsonify({'error': 'Please enter a valid Reelgood URL'}), 400
 
+    key = cache_key(url)
+    cached, age = get_cached(key)
+
+    # ?nocache=1 forces a fresh scrape
+    if cached is not None and age < CACHE_TTL and request.args.get('nocache') != '1':
+        logger.info(f"Serving cached result for: {url}")
+        return jsonify(cached)
+
+    if not waiting_requests.acquire(blocking=False):
+        return busy_response()
+
     try:
-        logger.info(f"Starting scrape for URL: {url}")
+        broadcast = join_scrape(key, url)
+        if broadcast is None:
+            return busy_response()
+        response, error = broadcast.wait()
+    except TimeoutError as e:
+        response, error = None, str(e)
+    finally:
+        waiting_requests.release()
 
-        # Scrape all regions
-        result = scrape_all_regions(url)
+    if error is not None:
+        if cached is not None:
+            return jsonify({**cached, 'stale': True})
+        return jsonify({'error': error}), 500
 
-        logger.info(f"Scrape completed for: {url}")
+    return jsonify(response)
 
-        if 'error' in result:
-            logger.error(f"Scrape error: {result['error']}")
-            return jsonify({'error': result['error']}), 500
 
-        # Format the response
-        response = {
-            'title': result['title'],
-            'url': result['url'],
-            'regions': []
-        }
+@app.route('/scrape/stream')
+def scrape_stream():
+    """
+    Streaming version of /scrape using Server-Sent Events.
 
-        for region_code, region_data in result['regions'].items():
-            response['regions'].append({
-                'code': region_code,
-                'name': region_data['region'],
-                'subscription': region_data['platforms']['subscription'],
-                'free': region_data['platforms']['free'],
-                'platform_count': region_data['platform_count']
-            })
+    Sends a "region" event as each region finishes, then a "done" event with
+    the full /scrape response (or an "error" event if the scrape fails).
+    """
+    url = request.args.get('url', '').strip()
 
-        return jsonify(response)
+    # Validate URL
+    if not url:
+        return jsonify({'error': 'Please enter a URL'}), 400
 
-    except Exception as e:
-        logger.exception(f"Scraping failed with exception: {str(e)}")
-        return jsonify({'error': f'Scraping failed: {str(e)}'}), 500
+    if 'reelgood.com' not in url:
+        return jsonify({'error': 'Please enter a valid Reelgood URL'}), 400
+
+    headers = {'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+
+    key = cache_key(url)
+    cached, age = get_cached(key)
+
+    # ?nocache=1 forces a fresh scrape
+    if cached is not None and age < CACHE_TTL and request.args.get('nocache') != '1':
+        logger.info(f"Streaming cached result for: {url}")
+
+        def generate_cached():
+            for region in cached['regions']:
+                yield sse_event('region', {'title': cached['title'], **region})
+            yield sse_event('done', cached)
+
+        return Response(generate_cached(), mimetype='text/event-stream', headers=headers)
+
+    if not waiting_requests.acquire(blocking=False):
+        return busy_response()
+
+    broadcast = join_scrape(key, url)
+    if broadcast is None:
+        waiting_requests.release()
+        return busy_response()
+
+    def generate():
+        # Disconnecting only stops this stream; the shared scrape carries on
+        # for other requests and the cache
+        try:
+            for event, data in broadcast.events():
+                if event == 'region':
+                    yield sse_event('region', {'title': broadcast.title, **data})
+                elif event == 'done':
+                    yield sse_event('done', data)
+                elif cached is not None:
+                    yield sse_event('done', {**cached, 'stale': True})
+                else:
+                    yield sse_event('error', {'error': data})
+        except TimeoutError as e:
+            if cached is not None:
+                yield sse_event('done', {**cached, 'stale': True})
+            else:
+                yield sse_event('error', {'error': str(e)})
+
+    # The waiting slot is freed when the response is closed, which also
+    # happens if the client disconnects mid-stream
+    return Response(
+        ClosingIterator(generate(), [waiting_requests.release]),
+        mimetype='text/event-stream',
+        headers=headers
+    )
 
 
 @app.route('/search', methods=['POST'])
+@limit_pending
 def search():
     """API endpoint to search for movies/shows on Reelgood"""
     data = request.get_json()
@@ -84,7 +419,7 @@ def search():
 
     try:
         logger.info(f"Searching for: {query}")
-        result = search_reelgood(query)
+        result = BROWSER_POOL.run(search_reelgood, query)
 
         if 'error' in result:
             logger.error(f"Search error: {result['error']}")
@@ -101,4 +436,4 @@ def search():
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 8080))
     debug = os.environ.get('FLASK_DEBUG', 'false').lower() == 'true'
-    app.run(host='0.0.0.0', port=port, debug=debug)
+    app.run(host='0.0.0.0', port=port, debug=debug, threaded=True)
@@ -10,33 +10,58 @@ Usage:
 
 import sys
 import time
-from reelgood_scraper import scrape_reelgood, generate_summary
+import threading
+from reelgood_scraper import BrowserPool, scrape_reelgood, generate_summary
 
-def process_urls(urls, delay=2):
+class RateLimiter:
+    """Space calls out so each starts at least `interval` seconds after the last"""
+
+    def __init__(self, interval):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.interval
+        time.sleep(start - now)
+
+def _scrape_politely(url, limiter, context=None):
+    """Wait for a rate limit slot, then scrape on the given browser context"""
+    limiter.wait()
+    return scrape_reelgood(url, context=context)
+
+def process_urls(urls, delay=2, workers=4):
     """
-    Process multiple URLs with delay between requests
+    Process multiple URLs in parallel, with a delay between request starts
     
     Args:
         urls: List of Reelgood URLs
-        delay: Seconds to wait between requests (be respectful!)
+        delay: Seconds between starting requests (be respectful!)
+        workers: Number of browsers scraping at once
     """
     results = []
+    limiter = RateLimiter(delay)
+    pool = BrowserPool(size=min(workers, len(urls)))
     
-    for i, url in enumerate(urls, 1):
-        print(f"\n{'='*60}")
-        print(f"Processing {i}/{len(urls)}: {url}")
-        print('='*60)
-        
-        data = scrape_reelgood(url)
-        summary = generate_summary(data)
-        print(summary)
-        
-        results.append(data)
+    try:
+        futures = [pool.submit(_scrape_politely, url, limiter) for url in urls]
         
-        # Be respectful - wait between requests
-        if i < len(urls):
-            print(f"\n⏳ Waiting {delay} seconds before next request...")
-            time.sleep(delay)
+        for i, (url, future) in enumerate(zip(urls, futures), 1):
+            data = future.result()
+            
+            print(f"\n{'='*60}")
+            print(f"Processed {i}/{len(urls)}: {url}")
+            print('='*60)
+            
+            summary = generate_summary(data)
+            print(summary)
+            
+            results.append(data)
+    finally:
+        pool.close()
     
     return results
 
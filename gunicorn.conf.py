@@ -0,0 +1,26 @@
+"""
+Gunicorn settings for the web app
+
+Usage:
+    gunicorn -c gunicorn.conf.py app:app
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 8080)}"
+
+# One worker by default: each worker process starts its own browser pool
+# (BROWSER_POOL_SIZE Chromiums) at import, and the in-flight dedupe and
+# pending-scrape cap are per process. Raise WEB_CONCURRENCY only on hosts with
+# memory to spare (os.cpu_count() reports host CPUs inside containers)
+workers = int(os.environ.get('WEB_CONCURRENCY', 1))
+
+# Scrapes are I/O-bound (request threads just wait on the browser pool), so
+# threads multiply throughput. Don't switch to gevent: its monkey-patching
+# breaks Playwright's sync API
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 16))
+
+# Extended timeout (300 seconds / 5 minutes) for slow scrapes
+timeout = 300
+keepalive = 65
@@ -21,11 +21,17 @@ Requirements:
     playwright install chromium
 """
 
-from playwright.sync_api import sync_playwright
+from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
 from playwright_stealth import Stealth
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError, as_completed
+from contextlib import contextmanager
 import sys
-import json
+import orjson
 import os
+import queue
+import tempfile
+import threading
+import itertools
 
 # Create a stealth instance to avoid bot detection
 stealth = Stealth()
@@ -40,6 +46,9 @@ REGIONS = {
     'nz': 'New Zealand',
 }
 
+# Region name (as shown in the dropdown) -> region code
+REGION_CODES = {name: code for code, name in REGIONS.items()}
+
 # Browser launch args for low-memory environments (Docker/Railway)
 BROWSER_ARGS = [
     '--disable-dev-shm-usage',  # Overcome limited /dev/shm in Docker
@@ -55,30 +64,335 @@ BROWSER_ARGS = [
     '--hide-scrollbars',
     '--metrics-recording-only',
     '--no-first-run',
+    # Fewer renderer processes per page: skip per-site process isolation.
+    # This is deliberately not a --disable-features=... switch: Playwright
+    # passes its own --disable-features list (Translate, PaintHolding,
+    # DestroyProfileOnBrowserClose, ...) and Chromium only keeps the last
+    # copy of a repeated switch, so adding one would re-enable those
+    '--disable-site-isolation-trials',
+    # Cap each renderer's JS heap
+    '--js-flags=--max-old-space-size=128',
 ]
 
+# Pool browsers are relaunched after this many jobs to reclaim memory that
+# Chromium leaks over time (like Gunicorn's max_requests)
+BROWSER_MAX_JOBS = int(os.environ.get('BROWSER_MAX_JOBS', 50))
+
+# How long callers wait on pool jobs (including time queued) before giving up
+BROWSER_JOB_TIMEOUT = int(os.environ.get('BROWSER_JOB_TIMEOUT', 180))
+
+# Pool browsers keep their profile (HTTP cache, cookies, compiled JS) here so
+# it survives browser restarts
+PROFILE_DIR = os.environ.get('BROWSER_PROFILE_DIR', os.path.join(tempfile.gettempdir(), 'reelgood-profile'))
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+VIEWPORT = {'width': 1280, 'height': 800}
+
+# Requests the scraper never needs. Logos are read from the <img> alt/src in
+# the DOM, so the image bytes themselves don't have to be downloaded.
+# Stylesheets are kept: region selection clicks on on-screen coordinates.
+BLOCKED_RESOURCE_TYPES = {'image', 'media', 'font'}
+BLOCKED_URL_PARTS = ('googletagmanager', 'google-analytics', 'doubleclick', 'segment.io', 'hotjar')
+
+
+def launch_browser(playwright):
+    """Launch headless Chromium with the low-memory args"""
+    return playwright.chromium.launch(headless=True, args=BROWSER_ARGS)
+
+
+def block_unneeded_requests(route):
+    """Route handler that aborts images, media, fonts and trackers"""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(part in request.url for part in BLOCKED_URL_PARTS):
+        route.abort()
+    else:
+        route.continue_()
+
+
+def new_context(browser):
+    """Create a browser context with our user agent and viewport"""
+    context = browser.new_context(user_agent=USER_AGENT, viewport=VIEWPORT)
+    context.route('**/*', block_unneeded_requests)
+    return context
+
+
+@contextmanager
+def browser_context(context=None):
+    """
+    Yield a browser context to scrape with.
+
+    If an existing context is passed in (e.g. from a BrowserPool) it is used
+    as-is and left open; otherwise a throwaway browser is launched and closed
+    when the block exits.
+    """
+    if context is not None:
+        yield context
+        return
+
+    with sync_playwright() as p:
+        browser = launch_browser(p)
+        try:
+            yield new_context(browser)
+        finally:
+            browser.close()
+
+
+class BrowserPool:
+    """
+    A fixed set of worker threads, each owning a long-lived Chromium.
+
+    Playwright's sync API is bound to the thread that started it, so a single
+    browser can't be handed around between request threads. Instead each
+    worker launches its own persistent browser context once and keeps it warm;
+    submitted jobs run on a worker and get its context passed as ``context``.
+    """
+
+    def __init__(self, size=1, max_jobs=BROWSER_MAX_JOBS):
+        self.size = size
+        self.max_jobs = max_jobs
+        self._jobs = queue.Queue()
+        self._workers = [
+            threading.Thread(target=self._work, name=f'browser-{i}', daemon=True)
+            for i in range(size)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def submit(self, fn, *args, **kwargs):
+        """Schedule fn(*args, context=<warm context>, **kwargs) and return a Future"""
+        future = Future()
+        self._jobs.put((future, fn, args, kwargs))
+        return future
+
+    def run(self, fn, *args, timeout=BROWSER_JOB_TIMEOUT, **kwargs):
+        """Run a job on the pool and wait (up to timeout seconds) for its result"""
+        future = self.submit(fn, *args, **kwargs)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise
+
+    def close(self, timeout=30):
+        """Stop the workers and close their browsers"""
+        for _ in self._workers:
+            self._jobs.put(None)
+        for worker in self._workers:
+            worker.join(timeout)
+
+    def _work(self):
+        try:
+            profile_dir, profile_lock = self._claim_profile_dir()
+        except Exception as e:
+            # Without a profile this worker can't launch a browser, but it must
+            # keep draining the queue so jobs it picks up fail instead of hanging
+            print(f"Warning: Could not claim a browser profile in {PROFILE_DIR}: {e}")
+            self._fail_jobs(e)
+            return
+
+        state = {
+            'playwright': None, 'browser': None, 'context': None, 'closed': True,
+            'profile_dir': profile_dir, 'jobs': 0
+        }
+
+        try:
+            self._start_browser(state)
+        except Exception as e:
+            # Leave it to the first job to retry and report the failure
+            print(f"Warning: Could not pre-launch browser: {e}")
+
+        try:
+            while True:
+                job = self._jobs.get()
+                if job is None:
+                    break
+
+                future, fn, args, kwargs = job
+                if not future.set_running_or_notify_cancel():
+                    continue
+
+                try:
+                    if state['closed']:
+                        self._stop_browser(state)
+                        self._start_browser(state)
+                    state['jobs'] += 1
+                    future.set_result(fn(*args, context=state['context'], **kwargs))
+                except BaseException as e:
+                    future.set_exception(e)
+
+                # The caller already has its result, so recycle now rather
+                # than making the next job wait for the relaunch
+                if self.max_jobs and state['jobs'] >= self.max_jobs:
+                    self._stop_browser(state)
+                    try:
+                        self._start_browser(state)
+                    except Exception as e:
+                        print(f"Warning: Could not relaunch browser: {e}")
+        finally:
+            self._stop_browser(state)
+            if profile_lock is not None:
+                profile_lock.close()
+
+    def _fail_jobs(self, error):
+        """Fail every job this worker picks up until the pool is closed"""
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            future = job[0]
+            if future.set_running_or_notify_cancel():
+                future.set_exception(RuntimeError(f"Browser worker unavailable: {error}"))
+
+    def _claim_profile_dir(self):
+        """
+        Pick a profile directory no other browser is using.
+
+        Chromium refuses to share a profile, and several pools (threads, or
+        Gunicorn worker processes) may run side by side. Each profile slot has
+        a lock file held for the worker's lifetime; the OS releases it if the
+        process dies, so slots get reused across restarts.
+
+        Returns (None, None) where file locking isn't available (Windows); the
+        worker then uses a regular, non-persistent context.
+        """
+        try:
+            import fcntl
+        except ImportError:
+            return None, None
+
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        for n in itertools.count():
+            path = os.path.join(PROFILE_DIR, f'profile-{n}')
+            lock = open(f'{path}.lock', 'w')
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                # Slot held by another browser, try the next one
+                lock.close()
+                continue
+            except BaseException:
+                lock.close()
+                raise
+            return path, lock
+
+    def _start_browser(self, state):
+        state['playwright'] = sync_playwright().start()
+        if state['profile_dir'] is None:
+            state['browser'] = launch_browser(state['playwright'])
+            context = new_context(state['browser'])
+        else:
+            context = state['playwright'].chromium.launch_persistent_context(
+                state['profile_dir'],
+                headless=True,
+                args=BROWSER_ARGS,
+                user_agent=USER_AGENT,
+                viewport=VIEWPORT
+            )
+            context.route('**/*', block_unneeded_requests)
+        # Relaunch on the next job if the browser crashes or disconnects
+        context.on('close', lambda _: state.update(closed=True))
+        state.update(context=context, closed=False, jobs=0)
+
+    def _stop_browser(self, state):
+        try:
+            if state['context'] is not None and not state['closed']:
+                state['context'].close()
+        except:
+            pass
+        try:
+            if state['browser'] is not None:
+                state['browser'].close()
+        except:
+            pass
+        try:
+            if state['playwright'] is not None:
+                state['playwright'].stop()
+        except:
+            pass
+        state.update(playwright=None, browser=None, context=None, closed=True)
+
 
 def get_current_region(page):
     """Get the currently selected region from the title-specific dropdown"""
     try:
-        # The dropdown button shows the current region - look for the span inside
-        # that contains just the country name (not the full dropdown menu)
-        region_span = page.query_selector('div.e3nus5z7 span.e3nus5z6, div[class*="e3nus5z"] > span')
-        if region_span:
-            text = region_span.inner_text().strip()
-            if text and text in ['Canada', 'United States', 'United Kingdom', 'Australia', 'New Zealand', 'All Regions']:
-                return text
-
-        # Fallback: look for the first line of the dropdown div
-        dropdown = page.query_selector('div.e3nus5z7, div[class*="e3nus5z"]')
-        if dropdown:
-            text = dropdown.inner_text().strip().split('\n')[0]
-            return text
+        # Read both candidates in a single round trip: the span inside the
+        # dropdown button that holds just the country name, and the first line
+        # of the dropdown div as a fallback
+        span_text, dropdown_text = page.evaluate('''() => {
+            const span = document.querySelector('div.e3nus5z7 span.e3nus5z6, div[class*="e3nus5z"] > span');
+            const dropdown = document.querySelector('div.e3nus5z7, div[class*="e3nus5z"]');
+            return [
+                span ? span.innerText.trim() : null,
+                dropdown ? dropdown.innerText.trim().split('\\n')[0] : null
+            ];
+        }''')
+        if span_text in REGION_CODES:
+            return span_text
+        if dropdown_text is not None:
+            return dropdown_text
     except:
         pass
     return "Unknown"
 
 
+def wait_for_dom_settle(page, quiet_ms=300, timeout_ms=3000):
+    """Wait until the Where to Watch list stops changing for quiet_ms (or timeout_ms passes)
+
+    Only nodes added/removed (or logo src/alt swapped) under the section holding
+    the service logos count, so unrelated carousels, spinners and timers can't keep it busy.
+    """
+    page.evaluate('''([quietMs, timeoutMs]) => new Promise(resolve => {
+        // Closest ancestor of the heading that holds the logos; body if the
+        // heading or logos haven't rendered yet
+        const heading = Array.from(document.querySelectorAll('h2'))
+            .find(h => h.textContent.includes('Where to Watch'));
+        let root = heading;
+        while (root && !root.querySelector('img[src*="service-logos"]')) {
+            root = root.parentElement;
+        }
+        root = root || document.body;
+        const done = () => {
+            observer.disconnect();
+            clearTimeout(quiet);
+            clearTimeout(deadline);
+            resolve();
+        };
+        const observer = new MutationObserver(() => {
+            clearTimeout(quiet);
+            quiet = setTimeout(done, quietMs);
+        });
+        let quiet = setTimeout(done, quietMs);
+        const deadline = setTimeout(done, timeoutMs);
+        // A re-render may reuse the <img>s and only swap src/alt, so watch those too
+        observer.observe(root, {childList: true, subtree: true, attributeFilter: ['src', 'alt']});
+    })''', [quiet_ms, timeout_ms])
+
+
+# Finds the on-screen dropdown option for a region and returns the point to
+# click. Options are DIVs with class e3nus5z3. The region name is passed as an
+# argument so the function is never rebuilt (or injected into) per call
+FIND_MENU_ITEM_JS = '''(target) => {
+    const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_ELEMENT);
+    while (walker.nextNode()) {
+        const el = walker.currentNode;
+        const text = el.textContent.trim();
+        // Check if this element directly contains the country name
+        const directText = Array.from(el.childNodes)
+            .filter(n => n.nodeType === Node.TEXT_NODE)
+            .map(n => n.textContent.trim())
+            .join('');
+
+        if (directText === target || (text === target && el.children.length === 0)) {
+            const rect = el.getBoundingClientRect();
+            if (rect.height > 0 && rect.width > 0 && rect.y > 0 && rect.y < 600) {
+                return {x: rect.x + rect.width/2, y: rect.y + rect.height/2};
+            }
+        }
+    }
+    return null;
+}'''
+
+
 def select_region(page, target_region):
     """Select a specific region from the title-specific dropdown"""
     try:
@@ -93,34 +407,31 @@ def select_region(page, target_region):
             return current
 
         dropdown.click()
-        page.wait_for_timeout(500)  # Wait for dropdown to open
-
-        # Find the target region option and get its coordinates
-        # Options are DIVs with class e3nus5z3
-        menu_item = page.evaluate(f'''() => {{
-            const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_ELEMENT);
-            while (walker.nextNode()) {{
-                const el = walker.currentNode;
-                const text = el.textContent.trim();
-                // Check if this element directly contains the country name
-                const directText = Array.from(el.childNodes)
-                    .filter(n => n.nodeType === Node.TEXT_NODE)
-                    .map(n => n.textContent.trim())
-                    .join('');
-
-                if (directText === "{target_region}" || (text === "{target_region}" && el.children.length === 0)) {{
-                    const rect = el.getBoundingClientRect();
-                    if (rect.height > 0 && rect.width > 0 && rect.y > 0 && rect.y < 600) {{
-                        return {{x: rect.x + rect.width/2, y: rect.y + rect.height/2}};
-                    }}
-                }}
-            }}
-            return null;
-        }}''')
+
+        # Wait for the dropdown to open and show the target option, then get
+        # its coordinates. Poll every 100 ms rather than every animation frame,
+        # since each check walks the whole document
+        try:
+            menu_item = page.wait_for_function(
+                FIND_MENU_ITEM_JS, arg=target_region, polling=100, timeout=2000
+            ).json_value()
+        except PlaywrightTimeoutError:
+            menu_item = None
 
         if menu_item:
             page.mouse.click(menu_item['x'], menu_item['y'])
-            page.wait_for_timeout(1200)  # Wait for content to update after region change
+
+            # Wait for the dropdown to show the new region, then for the
+            # platform list to finish re-rendering
+            page.wait_for_function(
+                '''(target) => {
+                    const span = document.querySelector('div.e3nus5z7 span.e3nus5z6, div[class*="e3nus5z"] > span');
+                    return span && span.innerText.trim() === target;
+                }''',
+                arg=target_region,
+                timeout=5000
+            )
+            wait_for_dom_settle(page)
             return target_region
 
         # Close dropdown if we couldn't find the option
@@ -139,72 +450,45 @@ def select_region(page, target_region):
 def extract_platforms(page):
     """Extract streaming platforms from the page (Free and Subscription only, no rent/buy)"""
 
-    # First check if there are any service logos on the page at all
-    logo_count = page.evaluate('() => document.querySelectorAll("img[src*=\\"service-logos\\"]").length')
-    print(f"    Found {logo_count} service logos on page")
-
-    # Use JavaScript to find platforms and their categories
-    platforms_data = page.evaluate('''() => {
-        const results = [];
+    # Find the category sections in one pass: from each "Free"/"Sub"/"Rent"/
+    # "Buy" header, the section is the closest ancestor whose first child reads
+    # as that category and which holds more than just the header. Every logo
+    # inside it belongs to that category
+    data = page.evaluate('''() => {
+        const CATEGORIES = ['Free', 'Sub', 'Rent', 'Buy'];
         const imgs = document.querySelectorAll('img[src*="service-logos"]');
-
-        for (const img of imgs) {
-            const platform = img.alt;
-            if (!platform) continue;
-
-            // Walk up the DOM to find the category (Free, Sub, Rent, Buy)
-            let el = img;
-            let category = '';
-
-            for (let i = 0; i < 15; i++) {
-                el = el.parentElement;
-                if (!el) break;
-
-                // Look for category section headers
-                const text = el.textContent || '';
-
-                // Check if we've reached a section with a category label
-                // Categories appear as section headers like "Free", "Sub", "Rent", "Buy"
-                const firstChild = el.firstElementChild;
-                if (firstChild) {
-                    const headerText = firstChild.textContent.trim();
-                    if (['Free', 'Sub', 'Rent', 'Buy'].includes(headerText)) {
-                        category = headerText;
-                        break;
-                    }
-                }
-
-                // Also check for category in class names or data attributes
-                if (el.className && typeof el.className === 'string') {
-                    if (el.className.includes('free')) category = 'Free';
-                    else if (el.className.includes('sub')) category = 'Sub';
-                    else if (el.className.includes('rent')) category = 'Rent';
-                    else if (el.className.includes('buy')) category = 'Buy';
-                    if (category) break;
+        const categoryOf = new Map();
+
+        const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+        while (walker.nextNode()) {
+            const category = walker.currentNode.textContent.trim();
+            if (!CATEGORIES.includes(category)) continue;
+
+            // Climb from the header to the enclosing section. The header text
+            // may sit anywhere inside the first child (e.g. after an icon)
+            for (let section = walker.currentNode.parentElement; section; section = section.parentElement) {
+                const first = section.firstElementChild;
+                if (!first || first.textContent.trim() !== category) continue;
+                if (section.textContent.trim() === category) continue;
+
+                // Sections are visited in document order, so nested (closer)
+                // sections overwrite their ancestors
+                for (const img of section.querySelectorAll('img[src*="service-logos"]')) {
+                    categoryOf.set(img, category);
                 }
+                break;
             }
-
-            // If still no category, try to infer from nearby text
-            if (!category) {
-                let sibling = img.parentElement;
-                for (let i = 0; i < 5 && sibling; i++) {
-                    const prev = sibling.previousElementSibling;
-                    if (prev) {
-                        const prevText = prev.textContent.trim();
-                        if (['Free', 'Sub', 'Rent', 'Buy'].includes(prevText)) {
-                            category = prevText;
-                            break;
-                        }
-                    }
-                    sibling = sibling.parentElement;
-                }
-            }
-
-            results.push({platform: platform, category: category || 'Unknown'});
         }
 
-        return results;
+        const results = [];
+        for (const img of imgs) {
+            if (!img.alt) continue;
+            results.push({platform: img.alt, category: categoryOf.get(img) || 'Unknown'});
+        }
+        return {logoCount: imgs.length, platforms: results};
     }''')
+    print(f"    Found {data['logoCount']} service logos on page")
+    platforms_data = data['platforms']
 
     # Separate into subscription and free platforms
     subscription_platforms = set()
@@ -222,51 +506,64 @@ def extract_platforms(page):
     }
 
 
-def scrape_reelgood(url, region=None):
+def load_title_page(page, url):
+    """Open a title page and wait until its Where to Watch section has rendered"""
+    page.goto(url, wait_until='domcontentloaded', timeout=30000)
+
+    try:
+        # Logo images are blocked (only their alt/src are read), so they may
+        # never count as visible; wait for them to be in the DOM instead
+        page.wait_for_selector('img[src*="service-logos"], h2:has-text("Where to Watch")', state='attached', timeout=15000)
+    except PlaywrightTimeoutError:
+        # Check if we hit a Cloudflare challenge page
+        page_title = page.title()
+        if 'just a moment' in page_title.lower() or page_title.strip() == '':
+            raise RuntimeError("Cloudflare challenge detected - page not loaded properly")
+        raise
+
+    # The heading can render before the logos, so give them a moment to show
+    # up (titles with no platforms never get any) and let the list settle
+    try:
+        page.wait_for_selector('img[src*="service-logos"]', state='attached', timeout=3000)
+    except PlaywrightTimeoutError:
+        pass
+    wait_for_dom_settle(page)
+
+    # Scroll to Where to Watch section
+    try:
+        page.locator('h2:has-text("Where to Watch")').first.scroll_into_view_if_needed(timeout=5000)
+    except PlaywrightTimeoutError:
+        pass
+
+
+def scrape_reelgood(url, region=None, context=None):
     """
     Scrape streaming availability from a Reelgood URL using Playwright.
 
     Args:
         url: Reelgood URL for a movie or TV show
         region: Optional region code (all, au, ca, uk, nz, us) or None for default
+        context: Optional existing browser context to scrape with (a throwaway
+            browser is launched if omitted)
 
     Returns:
         dict: Contains title, platforms, region info, and availability details
     """
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True, args=BROWSER_ARGS)
-        context = browser.new_context(
-            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            viewport={'width': 1280, 'height': 800}
-        )
+    with browser_context(context) as context:
         page = context.new_page()
 
         # Apply stealth techniques to avoid bot detection
         stealth.apply_stealth_sync(page)
 
         try:
-            page.goto(url, wait_until='domcontentloaded', timeout=30000)
-            page.wait_for_selector('h1', timeout=15000)
-            page.wait_for_timeout(1500)  # Wait for page content to load
-
-            # Scroll to Where to Watch section
-            page.evaluate('''() => {
-                const h2s = document.querySelectorAll('h2');
-                for (const h of h2s) {
-                    if (h.textContent.includes('Where to Watch')) {
-                        h.scrollIntoView({block: 'start'});
-                        break;
-                    }
-                }
-            }''')
-            page.wait_for_timeout(500)  # Wait for scroll
+            load_title_page(page, url)
 
-            # Select region if specified
+            # Select region if specified. select_region reports what ended up
+            # selected, so only read the dropdown back when no region was requested
             if region and region in REGIONS:
-                target_region = REGIONS[region]
-                select_region(page, target_region)
-
-            detected_region = get_current_region(page)
+                detected_region = select_region(page, REGIONS[region])
+            else:
+                detected_region = get_current_region(page)
 
             # Extract title
             title = "Unknown Title"
@@ -280,8 +577,6 @@ def scrape_reelgood(url, region=None):
             # Extract streaming platforms
             platforms = extract_platforms(page)
 
-            browser.close()
-
             return {
                 "title": title,
                 "platforms": platforms,
@@ -291,50 +586,23 @@ def scrape_reelgood(url, region=None):
             }
 
         except Exception as e:
-            browser.close()
             return {"error": f"Failed to scrape URL: {str(e)}"}
 
+        finally:
+            page.close()
 
-def scrape_all_regions(url):
-    """Scrape streaming availability for all regions"""
-    results = {}
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True, args=BROWSER_ARGS)
-        context = browser.new_context(
-            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            viewport={'width': 1280, 'height': 800}
-        )
+def _scrape_one_region(url, region_code, region_name, context=None):
+    """Load a title page in its own tab and scrape a single region"""
+    with browser_context(context) as context:
         page = context.new_page()
 
         # Apply stealth techniques to avoid bot detection
         stealth.apply_stealth_sync(page)
 
         try:
-            print(f"Loading URL: {url}")
-            page.goto(url, wait_until='domcontentloaded', timeout=30000)
-            page.wait_for_selector('h1', timeout=15000)
-            page.wait_for_timeout(1500)  # Wait for page content to load
-
-            # Check if we hit a Cloudflare challenge page
-            page_title = page.title()
-            print(f"Page title: {page_title}")
-            if 'just a moment' in page_title.lower() or page_title.strip() == '':
-                print("WARNING: Cloudflare challenge detected - page not loaded properly!")
-
-            # Scroll to Where to Watch section
-            page.evaluate('''() => {
-                const h2s = document.querySelectorAll('h2');
-                for (const h of h2s) {
-                    if (h.textContent.includes('Where to Watch')) {
-                        h.scrollIntoView({block: 'start'});
-                        break;
-                    }
-                }
-            }''')
-            page.wait_for_timeout(500)  # Wait for scroll
+            load_title_page(page, url)
 
-            # Get title once
             title = "Unknown Title"
             try:
                 title_elem = page.query_selector('h1')
@@ -343,53 +611,130 @@ def scrape_all_regions(url):
             except:
                 pass
 
-            # Scrape each region (skip 'all' for individual region scraping)
-            regions_to_scrape = {k: v for k, v in REGIONS.items() if k != 'all'}
+            print(f"  Scraping {region_name}...")
+            selected = select_region(page, region_name)
+            if selected != region_name:
+                # Don't label the default region's platforms as this region's
+                raise RuntimeError(f"Could not switch to {region_name} (page shows {selected})")
+            platforms = extract_platforms(page)
 
-            for region_code, region_name in regions_to_scrape.items():
-                print(f"  Scraping {region_name}...")
+            return {
+                "title": title,
+                "region": region_name,
+                "platforms": platforms,
+                "platform_count": len(platforms['subscription']) + len(platforms['free'])
+            }
 
-                select_region(page, region_name)
-                platforms = extract_platforms(page)
+        finally:
+            page.close()
 
-                results[region_code] = {
-                    "region": region_name,
-                    "platforms": platforms,
-                    "platform_count": len(platforms['subscription']) + len(platforms['free'])
-                }
 
-            browser.close()
+def _failed_region(region_name, error):
+    """Region result for a region that couldn't be scraped"""
+    return {
+        "title": "Unknown Title",
+        "region": region_name,
+        "error": str(error),
+        "platforms": {'subscription': [], 'free': []},
+        "platform_count": 0
+    }
 
-            return {
-                "title": title,
-                "url": url,
-                "regions": results
-            }
 
-        except Exception as e:
-            browser.close()
-            return {"error": f"Failed to scrape URL: {str(e)}"}
+def iter_all_regions(url, pool, timeout=BROWSER_JOB_TIMEOUT):
+    """
+    Scrape every region concurrently on a BrowserPool, yielding
+    (region_code, region_data) as each one finishes. region_data also carries
+    the page title. A region that fails (or hasn't finished within timeout
+    seconds) is yielded with an "error" key instead of aborting the others.
+    Closing the generator early cancels regions not yet started.
+    """
+    # Scrape each region (skip 'all' for individual region scraping)
+    regions_to_scrape = {k: v for k, v in REGIONS.items() if k != 'all'}
 
+    print(f"Loading URL: {url}")
+    futures = {
+        pool.submit(_scrape_one_region, url, region_code, region_name): region_code
+        for region_code, region_name in regions_to_scrape.items()
+    }
 
-def search_reelgood(query, max_results=10):
+    finished = set()
+    try:
+        try:
+            for future in as_completed(futures, timeout=timeout):
+                region_code = futures[future]
+                finished.add(region_code)
+                try:
+                    region_data = future.result()
+                except Exception as e:
+                    print(f"  {REGIONS[region_code]} failed: {e}")
+                    region_data = _failed_region(REGIONS[region_code], e)
+                yield region_code, region_data
+        except FutureTimeoutError:
+            for region_code in futures.values():
+                if region_code not in finished:
+                    yield region_code, _failed_region(REGIONS[region_code], f"Timed out after {timeout}s")
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def scrape_all_regions(url, pool=None):
+    """
+    Scrape streaming availability for all regions.
+
+    Each region is loaded in its own page and the regions are scraped
+    concurrently on the pool's browsers. If no BrowserPool is passed in, a
+    temporary one with a browser per region is started and closed afterwards.
+    """
+    results = {}
+    title = "Unknown Title"
+
+    own_pool = pool is None
+    if own_pool:
+        pool = BrowserPool(size=len(REGIONS) - 1)
+
+    try:
+        for region_code, region_data in iter_all_regions(url, pool):
+            region_title = region_data.pop('title')
+            if title == "Unknown Title":
+                title = region_title
+            results[region_code] = region_data
+
+    except Exception as e:
+        return {"error": f"Failed to scrape URL: {str(e)}"}
+
+    finally:
+        if own_pool:
+            pool.close()
+
+    # Partial results are still useful, but if nothing loaded report why
+    errors = [data['error'] for data in results.values() if 'error' in data]
+    if errors and len(errors) == len(results):
+        return {"error": f"Failed to scrape URL: {errors[0]}"}
+
+    return {
+        "title": title,
+        "url": url,
+        # Keep dropdown order regardless of which region finished first
+        "regions": {code: results[code] for code in REGIONS if code in results}
+    }
+
+
+def search_reelgood(query, max_results=10, context=None):
     """
     Search Reelgood for movies and TV shows.
 
     Args:
         query: Search query string
         max_results: Maximum number of results to return (default 10)
+        context: Optional existing browser context to search with
 
     Returns:
         dict: Contains search results with title, year, type, and URL
     """
     import urllib.parse
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True, args=BROWSER_ARGS)
-        context = browser.new_context(
-            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            viewport={'width': 1280, 'height': 800}
-        )
+    with browser_context(context) as context:
         page = context.new_page()
 
         # Apply stealth techniques to avoid bot detection
@@ -407,7 +752,6 @@ def search_reelgood(query, max_results=10):
             # Check for Cloudflare
             page_title = page.title()
             if 'just a moment' in page_title.lower():
-                browser.close()
                 return {"error": "Cloudflare challenge detected - search blocked"}
 
             # Extract search results
@@ -492,8 +836,6 @@ def search_reelgood(query, max_results=10):
                 return results;
             }''', max_results)
 
-            browser.close()
-
             return {
                 "query": query,
                 "results": results,
@@ -501,9 +843,11 @@ def search_reelgood(query, max_results=10):
             }
 
         except Exception as e:
-            browser.close()
             return {"error": f"Search failed: {str(e)}"}
 
+        finally:
+            page.close()
+
 
 def generate_summary(data, all_regions=False):
     """Generate a human-readable summary from scraped data"""
@@ -518,6 +862,9 @@ def generate_summary(data, all_regions=False):
         summary += f"\n{'=' * 60}\n"
 
         for region_code, region_data in data['regions'].items():
+            if 'error' in region_data:
+                summary += f"\n{region_data['region']}:\n  (Could not check: {region_data['error']})\n"
+                continue
             summary += f"\n{region_data['region']} ({region_data['platform_count']} platforms):\n"
             platforms = region_data['platforms']
             if platforms['subscription'] or platforms['free']:
@@ -616,11 +963,11 @@ if __name__ == "__main__":
         data = scrape_reelgood(test_url, region=region)
 
     if json_only:
-        print(json.dumps(data, indent=2))
+        print(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode())
     else:
         summary = generate_summary(data, all_regions=all_regions)
         print(summary)
 
         if debug:
             print("\nRaw data (debug mode):")
-            print(json.dumps(data, indent=2))
+            print(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode())